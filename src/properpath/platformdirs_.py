@@ -1,5 +1,3 @@
-import typing
-from dataclasses import asdict, dataclass
 from pathlib import Path
 
 from platformdirs import PlatformDirs
@@ -8,113 +6,97 @@ from platformdirs.macos import MacOS
 from platformdirs.unix import Unix
 from platformdirs.windows import Windows
 
-if typing.TYPE_CHECKING:
-    from .properpath import ProperPath
-
-
-@dataclass(frozen=True)
-class PlatformDirsCommonAttrs:
+# Names of the platformdirs attributes that are wrapped with path_cls. Their
+# ProperPath types are declared in platformdirs_.pyi only, so IDEs/editors
+# auto-suggestion works with an instantiated P.platformdirs() object without
+# adding a mixin to the runtime MRO.
+_PATCHED_ATTRS: frozenset[str] = frozenset(
+    {
+        "site_cache_dir",
+        "site_cache_path",
+        "site_config_dir",
+        "site_config_path",
+        "site_data_dir",
+        "site_data_path",
+        "site_runtime_dir",
+        "site_runtime_path",
+        "user_cache_dir",
+        "user_cache_path",
+        "user_config_dir",
+        "user_config_path",
+        "user_data_dir",
+        "user_data_path",
+        "user_desktop_dir",
+        "user_desktop_path",
+        "user_documents_dir",
+        "user_documents_path",
+        "user_downloads_dir",
+        "user_downloads_path",
+        "user_log_dir",
+        "user_log_path",
+        "user_music_dir",
+        "user_music_path",
+        "user_pictures_dir",
+        "user_pictures_path",
+        "user_runtime_dir",
+        "user_runtime_path",
+        "user_state_dir",
+        "user_state_path",
+        "user_videos_dir",
+    }
+)
+
+
+class _PlatformDirsPathAttr:
     """
-    PlatformDirsCommonAttrs defines the main attributes of platformdirs.
-    This class is used as a mixin, and it also ensures that IDEs/editors auto-suggestion works
-    with an instantiated P.platformdirs() object.
+    A non-data descriptor that wraps a platformdirs attribute of the base class
+    with `path_cls`. A new path is built on every access, so changes to the
+    instance (e.g., `version`), to the environment (e.g., `XDG_*` variables) and
+    `ensure_exists=True` are honored just like by platformdirs itself.
     """
 
-    site_cache_dir: "ProperPath" = NotImplemented
-    site_cache_path: "ProperPath" = NotImplemented
-    site_config_dir: "ProperPath" = NotImplemented
-    site_config_path: "ProperPath" = NotImplemented
-    site_data_dir: "ProperPath" = NotImplemented
-    site_data_path: "ProperPath" = NotImplemented
-    site_runtime_dir: "ProperPath" = NotImplemented
-    site_runtime_path: "ProperPath" = NotImplemented
-    user_cache_dir: "ProperPath" = NotImplemented
-    user_cache_path: "ProperPath" = NotImplemented
-    user_config_dir: "ProperPath" = NotImplemented
-    user_config_path: "ProperPath" = NotImplemented
-    user_data_dir: "ProperPath" = NotImplemented
-    user_data_path: "ProperPath" = NotImplemented
-    user_desktop_dir: "ProperPath" = NotImplemented
-    user_desktop_path: "ProperPath" = NotImplemented
-    user_documents_dir: "ProperPath" = NotImplemented
-    user_documents_path: "ProperPath" = NotImplemented
-    user_downloads_dir: "ProperPath" = NotImplemented
-    user_downloads_path: "ProperPath" = NotImplemented
-    user_log_dir: "ProperPath" = NotImplemented
-    user_log_path: "ProperPath" = NotImplemented
-    user_music_dir: "ProperPath" = NotImplemented
-    user_music_path: "ProperPath" = NotImplemented
-    user_pictures_dir: "ProperPath" = NotImplemented
-    user_pictures_path: "ProperPath" = NotImplemented
-    user_runtime_dir: "ProperPath" = NotImplemented
-    user_runtime_path: "ProperPath" = NotImplemented
-    user_state_dir: "ProperPath" = NotImplemented
-    user_state_path: "ProperPath" = NotImplemented
-    user_videos_dir: "ProperPath" = NotImplemented
-
+    def __init__(self, owner: type, name: str):
+        self.name = name
+        # The base class property getter is looked up once here, so no super()
+        # object or property dispatch is needed on access. All platformdirs
+        # attributes are properties.
+        self.fget = getattr(super(owner, owner), name).fget
 
-platformdirs_attrs = PlatformDirsCommonAttrs()
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return instance.path_cls(self.fget(instance))
 
 
 class _PlatformDirsGetAttrPatcher:
-    def __init__(self, path_cls: type[Path]):
-        self.path_cls = path_cls
-
-    def patch(
-        self,
-        attr: str,
-        super_obj: PlatformDirs | Unix | MacOS | Windows | Android,
-    ):
-        if attr in asdict(platformdirs_attrs).keys():
-            return self.path_cls(getattr(super_obj, attr))
-        return super_obj.__getattribute__(attr)
+    # The patched attributes are not cached on the instance, so path_cls is
+    # the only state the patcher adds. The platformdirs base classes still
+    # provide an instance __dict__ for their own attributes.
+    __slots__ = ("path_cls",)
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for attr in _PATCHED_ATTRS:
+            setattr(cls, attr, _PlatformDirsPathAttr(cls, attr))
 
-# MyPy complains about the attributes of PlatformDirsCommonAttrs to be of different
-# types (ProperPath) from the base class PlatformDirs's attributes' types (str).
-# Hence, ProperPlatformDirs and similar classes are type-ignored.
-class ProperPlatformDirs(  # type: ignore
-    _PlatformDirsGetAttrPatcher, PlatformDirs, PlatformDirsCommonAttrs
-):
     def __init__(self, *args, path_cls: type[Path], **kwargs):
-        super().__init__(path_cls=path_cls)
-        super(PlatformDirs, self).__init__(*args, **kwargs)
-
-    def __getattribute__(self, item):
-        return super().patch(item, super())
-
-
-class ProperUnix(_PlatformDirsGetAttrPatcher, Unix, PlatformDirsCommonAttrs):  # type: ignore
-    def __init__(self, *args, path_cls: type[Path], **kwargs):
-        super().__init__(path_cls=path_cls)
-        super(Unix, self).__init__(*args, **kwargs)
-
-    def __getattribute__(self, item):
-        return super().patch(item, super())
-
-
-class ProperMacOS(_PlatformDirsGetAttrPatcher, MacOS, PlatformDirsCommonAttrs):  # type: ignore
-    def __init__(self, *args, path_cls: type[Path], **kwargs):
-        super().__init__(path_cls=path_cls)
-        super(MacOS, self).__init__(*args, **kwargs)
-
-    def __getattribute__(self, item):
-        return super().patch(item, super())
-
-
-class ProperAndroid(_PlatformDirsGetAttrPatcher, Android, PlatformDirsCommonAttrs):  # type: ignore
-    def __init__(self, *args, path_cls: type[Path], **kwargs):
-        super().__init__(path_cls=path_cls)
-        super(Android, self).__init__(*args, **kwargs)
+        self.path_cls = path_cls
+        super().__init__(*args, **kwargs)
 
-    def __getattribute__(self, item):
-        return super().patch(item, super())
 
+def _proper_platformdirs_cls(name: str, base: type[PlatformDirs]) -> type:
+    """
+    Builds a `Proper*` subclass of the given platformdirs class whose
+    platformdirs attributes are wrapped with `path_cls`.
+    """
+    return type(name, (_PlatformDirsGetAttrPatcher, base), {"__module__": __name__})
 
-class ProperWindows(_PlatformDirsGetAttrPatcher, Windows, PlatformDirsCommonAttrs):  # type: ignore
-    def __init__(self, *args, path_cls: type[Path], **kwargs):
-        super().__init__(path_cls=path_cls)
-        super(Windows, self).__init__(*args, **kwargs)
 
-    def __getattribute__(self, item):
-        return super().patch(item, super())
+# The attribute types (ProperPath) of these classes differ from the base
+# class PlatformDirs's attribute types (str). platformdirs_.pyi declares
+# the ProperPath types for MyPy and IDEs.
+ProperPlatformDirs = _proper_platformdirs_cls("ProperPlatformDirs", PlatformDirs)
+ProperUnix = _proper_platformdirs_cls("ProperUnix", Unix)
+ProperMacOS = _proper_platformdirs_cls("ProperMacOS", MacOS)
+ProperAndroid = _proper_platformdirs_cls("ProperAndroid", Android)
+ProperWindows = _proper_platformdirs_cls("ProperWindows", Windows)
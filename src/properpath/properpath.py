@@ -1,9 +1,10 @@
-import itertools
 import logging
+import os
+import stat
 import sys
 from copy import deepcopy
+from functools import cache
 from pathlib import Path
-from shutil import rmtree
 from typing import Any, Iterable, Literal, Optional, Self, Union
 
 from .platformdirs_ import ProperPlatformDirs, ProperUnix
@@ -27,12 +28,10 @@ except ImportError as import_error:
             f"{_get_pydantic_core_schema.__name__} to work."
         ) from error
 else:
-    # noinspection PyUnusedLocal
-    # Mypy complains: "All conditional function variants must have identical signatures".
-    # In this case, it doesn't matter and can be ignored.
-    def _get_pydantic_core_schema(  # type: ignore
-        cls, source_type: Any, handler: GetCoreSchemaHandler
-    ) -> core_schema.CoreSchema:
+    # The schema only depends on cls (source_type and handler are unused),
+    # so it's built once per class.
+    @cache
+    def _build_pydantic_core_schema(cls) -> core_schema.CoreSchema:
         from_string_validator = core_schema.no_info_plain_validator_function(cls)
         python_schema = core_schema.union_schema(
             [
@@ -51,6 +50,57 @@ else:
             json_schema=json_schema, python_schema=python_schema
         )
 
+    # noinspection PyUnusedLocal
+    # Mypy complains: "All conditional function variants must have identical signatures".
+    # In this case, it doesn't matter and can be ignored.
+    def _get_pydantic_core_schema(  # type: ignore
+        cls, source_type: Any, handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        return _build_pydantic_core_schema(cls)
+
+
+if sys.version_info >= (3, 13):
+
+    def _read_text(
+        path: Path,
+        encoding: Optional[str],
+        errors: Optional[str],
+        newline: Optional[str],
+    ) -> str:
+        return Path.read_text(path, encoding, errors, newline)
+else:
+    # noinspection PyUnusedLocal
+    # newline is only supported by Path.read_text in Python 3.13 and above.
+    def _read_text(
+        path: Path,
+        encoding: Optional[str],
+        errors: Optional[str],
+        newline: Optional[str],
+    ) -> str:
+        return Path.read_text(path, encoding, errors)
+
+
+class _PathSourceMessage:
+    """
+    A path message for logs and exceptions that is only formatted when it is converted to a string.
+    Most debug messages are never emitted, so their path messages never need to be formatted.
+    """
+
+    __slots__ = ("source", "target")
+
+    def __init__(
+        self, source: Union[Path, str, Iterable[str]], target: Union[Path, str]
+    ):
+        self.source = source
+        self.target = target
+
+    def __str__(self) -> str:
+        return (
+            f"PATH={self.target} from SOURCE={self.source}"
+            if str(self.source) != str(self.target)
+            else f"PATH={self.target}"
+        )
+
 
 class NoException(Exception):
     """
@@ -82,6 +132,18 @@ class ProperPath(Path):
             logger `err_logger` is provided to an instance.
     """
 
+    # Like pathlib.Path, ProperPath instances have no __dict__. This keeps the many ProperPath
+    # instances pathlib creates (e.g., with parent, iterdir, glob) small. Unlike pathlib.Path,
+    # ProperPath instances can still be weakly referenced.
+    __slots__ = (
+        "_actual",
+        "_expanded_path",
+        "_kind",
+        "_user_expects_kind",
+        "_err_logger",
+        "_PathException",
+        "__weakref__",
+    )
     default_err_logger: logging.Logger = logging.getLogger()
     metadata_file_by_platforms: dict[str, set[str]] = {
         PlatformNames.darwin.value: {
@@ -131,11 +193,36 @@ class ProperPath(Path):
 
         self._user_expects_kind: bool
         self._kind: Literal["file", "dir"] | None
-        self.actual = actual
-        super().__init__(self._expanded)
+        # We want to be able to pass a ProperPath() to ProperPath().
+        # If Path instances aren't converted to str this way,
+        # weird issues like "AttributeError: object has
+        # no attribute '_raw_paths'. Did you mean: '_raw_path'?" can happen.
+        # A list comprehension is used since it's inlined (PEP 709), unlike a generator expression.
+        self._actual = tuple(
+            [
+                os.fspath(segment) if isinstance(segment, Path) else segment
+                for segment in actual
+            ]
+        )
+        # The expanded path is used by almost every operation (e.g., create(), remove()),
+        # so it's computed once on first access (see _expanded) instead of on every access.
+        self._expanded_path: Optional[Path] = None
+        # Path.expanduser() can only change a path that contains a "~". The check is done
+        # on the raw segments, and not only on their first character, since pathlib drops
+        # a leading "./" (e.g., "./~/docs" is parsed as "~/docs"). Otherwise, the segments
+        # are passed as they are, and the expanded path is only computed when it's first needed.
+        if any("~" in os.fspath(segment) for segment in self._actual):
+            super().__init__(self._expanded)
+        else:
+            super().__init__(*self._actual)
         self.kind = kind
-        self.err_logger = err_logger or ProperPath.default_err_logger
-        self.PathException = NoException
+        if err_logger is None:
+            # default_err_logger needs no validation by the err_logger setter.
+            self._err_logger = ProperPath.default_err_logger
+        else:
+            self.err_logger = err_logger
+        # NoException needs no validation by the PathException setter.
+        self._PathException: type[BaseException] = NoException
 
     @classmethod
     def platformdirs(
@@ -242,16 +329,20 @@ class ProperPath(Path):
         return dirs
 
     def __str__(self):
-        return str(self._expanded)
+        # The underlying Path is initialized with the expanded path whenever expanduser() could change it
+        # (see __init__), so its cached string is the expanded path string. This avoids building
+        # the separate _expanded Path just for str() and os.fspath().
+        return super().__str__()
 
     def __repr__(self):
         """
         Returns:
             (str): An information-rich representation of the ProperPath instance.
         """
+        exists, is_symlink = self._exists_and_is_symlink()
         return (
             f"{self.__class__.__name__}(path={self}, actual={self.actual}, "
-            f"kind={self.kind}, exists={self.exists()}, is_symlink={self.is_symlink()}, "
+            f"kind={self.kind}, exists={exists}, is_symlink={is_symlink}, "
             f"err_logger={self.err_logger})"
         )
 
@@ -260,13 +351,23 @@ class ProperPath(Path):
         Enables rich __repr__ support.
         See [rich REPR protocol documentation](https://rich.readthedocs.io/en/latest/pretty.html#rich-repr-protocol).
         """
+        exists, is_symlink = self._exists_and_is_symlink()
         yield "path", str(self)
         yield "actual", self.actual
         yield "kind", self.kind
-        yield "exists", self.exists()
-        yield "is_symlink", self.is_symlink()
+        yield "exists", exists
+        yield "is_symlink", is_symlink
         yield "err_logger", self.err_logger
 
+    def _exists_and_is_symlink(self) -> tuple[bool, bool]:
+        # A single lstat call answers both exists() and is_symlink().
+        # Only for a symlink, exists() needs another stat call for the symlink target.
+        try:
+            is_symlink = stat.S_ISLNK(os.lstat(self).st_mode)
+        except (OSError, ValueError):
+            return False, False
+        return (os.path.exists(self) if is_symlink else True), is_symlink
+
     def __hash__(self):
         return super().__hash__()
 
@@ -287,7 +388,16 @@ class ProperPath(Path):
             return memo_instance
         instance = self.__class__(self)
         memo[id(self)] = instance
-        instance.__dict__.update(deepcopy(self.__dict__, memo))
+        # ProperPath's own attributes are immutable (or a shared logger), so they're copied
+        # as they are.
+        for name in ProperPath.__slots__:
+            if name != "__weakref__":
+                setattr(instance, name, getattr(self, name))
+        # Any other attribute (e.g., added by a subclass without __slots__) is deep-copied.
+        if instance_dict := getattr(self, "__dict__", None):
+            instance.__dict__.update(
+                {key: deepcopy(value, memo) for key, value in instance_dict.items()}
+            )
         return instance
 
     @classmethod
@@ -304,7 +414,14 @@ class ProperPath(Path):
         return super().__eq__(to)
 
     def __truediv__(self, other) -> "ProperPath":
-        return ProperPath(self._expanded / other, err_logger=self.err_logger)
+        # The (already expanded) path and other are joined as strings, so actual stays a single
+        # segment. Joining them into a new Path first would mean parsing the joined path string twice.
+        try:
+            path = os.path.join(os.fspath(self), other)
+        except TypeError:
+            # Like pathlib, so that other.__rtruediv__ is tried
+            return NotImplemented
+        return ProperPath(path, err_logger=self.err_logger)
 
     @property
     def actual(self) -> Iterable[str]:
@@ -312,7 +429,7 @@ class ProperPath(Path):
         Provides access to the user-given path (or path segments) that was passed to the constructor of the
         `ProperPath` instance. `ProperPath`, by default, expands any user indicator `"~"`
         automatically and uses the expanded path for all operations. The `actual` attribute will reveal
-        the non-expanded original value.
+        the non-expanded original value. `actual` is read-only.
 
         Example:
             ```python
@@ -327,17 +444,11 @@ class ProperPath(Path):
 
     @actual.setter
     def actual(self, value) -> None:
-        segments = []
-        for segment in value:
-            if isinstance(
-                segment, (ProperPath, Path)
-            ):  # We want to be able to pass a ProperPath() to ProperPath()
-                segment = str(segment)
-                # If this isn't handled this way for Path instances,
-                # weird issues like "AttributeError: object has
-                # no attribute '_raw_paths'. Did you mean: '_raw_path'?" can happen.
-            segments.append(segment)
-        self._actual = tuple(segments)
+        # Like pathlib.Path, a ProperPath is immutable: the underlying Path (e.g., str(), hash(), parts)
+        # is built once in __init__ from the given segments, and cannot follow a new value.
+        raise AttributeError(
+            "actual is not meant to be modified. Create a new ProperPath instead."
+        )
 
     @property
     def err_logger(self):
@@ -416,7 +527,9 @@ class ProperPath(Path):
 
     @property
     def _expanded(self) -> Path:
-        return Path(*self.actual).expanduser()
+        if self._expanded_path is None:
+            self._expanded_path = Path(*self._actual).expanduser()
+        return self._expanded_path
 
     @_expanded.setter
     def _expanded(self, value) -> None:
@@ -434,16 +547,21 @@ class ProperPath(Path):
         Returns:
             (Literal["file", "dir"]): "file" or "dir" depending on the path.
         """
-        if self._kind is None or self._user_expects_kind is False:
-            self._kind = (
-                "dir"
-                if super().is_dir()
-                else "file"
-                if (super().is_file() or super().suffix or super().exists())
-                # self.exists() for special files like /dev/null
-                # since is_file() doesn't consider /dev/null to be a file!
-                else "dir"
-            )
+        # The kind setter never leaves _kind as None when the user expects a kind.
+        if self._user_expects_kind and self._kind is not None:
+            return self._kind
+        # A single stat call replaces the is_dir(), is_file() and exists() chain.
+        # Only a missing path falls back to the suffix guess; other errors (e.g.,
+        # PermissionError) are raised like they are by Path.is_dir().
+        try:
+            is_dir = stat.S_ISDIR(os.stat(self).st_mode)
+        except (FileNotFoundError, NotADirectoryError, ValueError):
+            self._kind = "file" if super().suffix else "dir"
+        else:
+            # Anything that exists and isn't a directory is a file. This includes
+            # special files like /dev/null since is_file() doesn't consider
+            # /dev/null to be a file!
+            self._kind = "dir" if is_dir else "file"
         return self._kind
 
     @kind.setter
@@ -467,12 +585,8 @@ class ProperPath(Path):
     @staticmethod
     def _error_helper_compare_path_source(
         source: Union[Path, str, Iterable[str]], target: Union[Path, str]
-    ) -> str:
-        return (
-            f"PATH={target} from SOURCE={source}"
-            if str(source) != str(target)
-            else f"PATH={target}"
-        )
+    ) -> _PathSourceMessage:
+        return _PathSourceMessage(source, target)
 
     def create(self, verbose: bool = True) -> None:
         """
@@ -496,92 +610,100 @@ class ProperPath(Path):
         Returns:
             None
         """
-        path = super().resolve(strict=False)
+        path = self._expanded
+        # Resolving walks every path component (one lstat each). This is only needed
+        # for relative paths, ".." segments (that mkdir should not see), and a symlink
+        # that should be created at its target.
+        if not path.is_absolute() or ".." in path.parts or path.is_symlink():
+            path = path.resolve(strict=False)
         try:
             match self.kind:
                 case "file":
-                    path_parent, path_file = path.parent, path.name
-                    if not path_parent.exists() and verbose:
+                    path_parent = path.parent
+                    # The exists() check only serves the debug message, so it's skipped
+                    # when the message wouldn't be logged anyway.
+                    if (
+                        verbose
+                        and self.err_logger.isEnabledFor(logging.DEBUG)
+                        and not path_parent.exists()
+                    ):
                         self.err_logger.debug(
-                            f"File {self._error_helper_compare_path_source(self.actual, path_parent)} "
-                            f"could not be found. An attempt to create file "
-                            f"{path_parent} will be made."
+                            "File %s could not be found. An attempt to create file "
+                            "%s will be made.",
+                            self._error_helper_compare_path_source(
+                                self.actual, path_parent
+                            ),
+                            path_parent,
                         )
                     path_parent.mkdir(parents=True, exist_ok=True)
-                    (path_parent / path_file).touch(exist_ok=True)
-                    if not (path_parent / path_file).is_file():
+                    path.touch(exist_ok=True)
+                    # touch(exist_ok=True) doesn't fail for an existing directory,
+                    # so the path is checked once more.
+                    if path.is_dir():
                         is_a_dir_exception = IsADirectoryError
                         message = (
                             "File was expected but a directory with the same name was found: "
-                            f"{self._error_helper_compare_path_source(self.actual, path_parent)}. "
+                            f"{self._error_helper_compare_path_source(self.actual, path)}. "
                         )
                         self.err_logger.debug(message)
                         raise is_a_dir_exception(message)
                 case "dir":
-                    if not path.exists() and verbose:
+                    if (
+                        verbose
+                        and self.err_logger.isEnabledFor(logging.DEBUG)
+                        and not path.exists()
+                    ):
                         self.err_logger.debug(
-                            f"Directory {self._error_helper_compare_path_source(self.actual, path)} "
-                            f"could not be found. An attempt to create directory "
-                            f"{path} will be made."
+                            "Directory %s could not be found. An attempt to create directory "
+                            "%s will be made.",
+                            self._error_helper_compare_path_source(self.actual, path),
+                            path,
                         )
                     path.mkdir(parents=True, exist_ok=True)
-        except (permission_exception := PermissionError) as e:
-            message = f"Permission to create {self._error_helper_compare_path_source(self.actual, path)} is denied."
-            self.err_logger.debug(message)
-            self.PathException = permission_exception
-            raise e
-        except tuple(OSError.__subclasses__()) as e:
-            self.err_logger.debug(
-                f"Could not create {self._error_helper_compare_path_source(self.actual, path)}. "
-                f"Exception: {e!r}"
-            )
-            self.PathException = e
-            raise e
-        except (os_exception := OSError) as os_err:
+        except OSError as e:
             # When an attempt to create a file or directory inside root (e.g., '/foo')
             # is made, OS can throw OSError with error no. 30 instead of PermissionError.
-            self.err_logger.debug(
-                f"Could not create {self._error_helper_compare_path_source(self.actual, path)}. "
-                f"Exception: {os_err!r}"
-            )
-            self.PathException = os_exception
-            raise os_err
+            if isinstance(e, PermissionError):
+                self.err_logger.debug(
+                    "Permission to create %s is denied.",
+                    self._error_helper_compare_path_source(self.actual, path),
+                )
+            else:
+                self.err_logger.debug(
+                    "Could not create %s. Exception: %r",
+                    self._error_helper_compare_path_source(self.actual, path),
+                    e,
+                )
+            self._PathException = type(e)
+            raise e
 
     def _remove_file(
-        self, _file: Union[Path, Self, None] = None, verbose: bool = True
+        self, _file: Union[Path, Self, str, None] = None, verbose: bool = True
     ) -> None:
         file = _file or self._expanded
-        if not isinstance(file, Path):
+        if not isinstance(file, (Path, str)):
             raise ValueError(
-                f"PATH={file} is empty or isn't a valid pathlib.Path instance! "
+                f"PATH={file} is empty or isn't a valid path! "
                 f"Check instance attribute 'expanded'."
             )
         try:
-            file.unlink()
-        except (permission_exception := PermissionError) as e:
-            message = (
-                f"Permission to remove {self._error_helper_compare_path_source(self.actual, file)} "
-                f"as a file is denied."
-            )
-            self.err_logger.debug(message)
-            self.PathException = permission_exception
-            raise e
-        except tuple(OSError.__subclasses__()) as e:
-            self.err_logger.debug(
-                f"Could not remove {self._error_helper_compare_path_source(self.actual, file)}. "
-                f"Exception: {e!r}"
-            )
-            self.PathException = e
-            raise e
-        except (os_exception := OSError) as e:
-            self.err_logger.debug(
-                f"Could not remove {self._error_helper_compare_path_source(self.actual, file)}. "
-                f"Exception: {e!r}"
-            )
-            self.PathException = os_exception
+            os.unlink(file)
+        except OSError as e:
+            if isinstance(e, PermissionError):
+                self.err_logger.debug(
+                    "Permission to remove %s as a file is denied.",
+                    self._error_helper_compare_path_source(self.actual, file),
+                )
+            else:
+                self.err_logger.debug(
+                    "Could not remove %s. Exception: %r",
+                    self._error_helper_compare_path_source(self.actual, file),
+                    e,
+                )
+            self._PathException = type(e)
             raise e
         if verbose:
-            self.err_logger.debug(f"Removed file: {file}")
+            self.err_logger.debug("Removed file: %s", file)
 
     def remove(self, parent_only: bool = False, verbose: bool = True) -> None:
         """
@@ -607,63 +729,68 @@ class ProperPath(Path):
             case "file":
                 self._remove_file(verbose=verbose)
             case "dir":
-                ls_ref: Iterable[Path]
-                ls_ref = (
-                    super().glob(r"**/*") if not parent_only else super().glob(r"*")
-                )
-                ls_ref = list(ls_ref)
-                if ls_ref:
-                    for ref in ls_ref:
-                        match (ref_path := ProperPath(ref)).kind:
-                            case "file" if ref_path.exists():
-                                self._remove_file(_file=ref, verbose=verbose)
-                                # Either FileNotFoundError and PermissionError occurring can mean that
-                                # a dir path was passed when its kind is set as "file"
-                            case "dir" if not parent_only and ref_path.exists():
-                                rmtree(ref)
-                                # A subdir can delete files inside first, but ls_ref will still have old
-                                # (already copied from ls_ref generator) files/folders,
-                                # hence the ref_path.exists() check to avoid repeated deletions.
+                # shutil (which imports bz2, lzma, fnmatch, etc.) is only needed here,
+                # so it's imported on first use instead of with properpath.
+                from shutil import rmtree
+
+                # Only the top-level entries are iterated: directories are removed with
+                # rmtree as a whole, so their contents never need to be listed here.
+                # os.DirEntry caches the file type from the directory listing, so
+                # no extra stat call or ProperPath instance is needed per entry.
+                # Entries are removed while the listing is streamed, which is safe
+                # since an entry is only ever removed after it has been yielded.
+                is_empty = True
+                try:
+                    ls_ref = os.scandir(self)
+                except FileNotFoundError:
+                    pass
+                else:
+                    with ls_ref:
+                        for ref in ls_ref:
+                            is_empty = False
+                            if not ref.is_dir(follow_symlinks=False):
+                                # Symlinks are removed like files, so the directory a symlink
+                                # points to is never deleted. With parent_only, a symlink to a
+                                # directory is left as is like any other top-level directory.
+                                if parent_only and ref.is_dir():
+                                    continue
+                                self._remove_file(_file=ref.path, verbose=verbose)
+                            elif not parent_only:
+                                rmtree(ref.path)
                                 self.err_logger.debug(
-                                    f"Deleted directory (recursively): {ref}"
+                                    "Deleted directory (recursively): %s", ref.path
                                 ) if verbose else ...
                                 # rmtree deletes files and directories recursively.
                                 # So in case of permission error with rmtree(ref),
                                 # shutil.rmtree() might give better
                                 # traceback message. I.e., which file or directory exactly
-                else:
-                    if not parent_only:
-                        super().rmdir()
-                        self.err_logger.debug(
-                            f"Deleted empty directory: {self._expanded}"
-                        ) if verbose else ...
+                if is_empty and not parent_only:
+                    super().rmdir()
+                    self.err_logger.debug(
+                        "Deleted empty directory: %s", self._expanded
+                    ) if verbose else ...
 
     def open(self, mode="r", encoding=None, *args, **kwargs):
         """
-        ProperPath open first resolves the whole path and then simply returns pathlib.Path.open.
+        ProperPath open simply returns pathlib.Path.open for the expanded path.
         This method is mainly overloaded to log exceptions.
         """
-        file = self._expanded
         try:
-            return Path(file).open(
+            # The underlying Path already points to the expanded path (see __str__),
+            # so the separate _expanded Path is only needed for the error message.
+            return super().open(
                 mode=mode,
                 encoding=encoding,
                 *args,
                 **kwargs,
             )
-        except tuple(OSError.__subclasses__()) as e:
+        except OSError as e:
             self.err_logger.debug(
-                f"Could not open file {self._error_helper_compare_path_source(self.actual, file)}. "
-                f"Exception: {e!r}"
+                "Could not open file %s. Exception: %r",
+                self._error_helper_compare_path_source(self.actual, self._expanded),
+                e,
             )
-            self.PathException = e
-            raise e
-        except (os_exception := OSError) as e:
-            self.err_logger.debug(
-                f"Could not open file {self._error_helper_compare_path_source(self.actual, file)}. "
-                f"Exception: {e!r}"
-            )
-            self.PathException = os_exception
+            self._PathException = type(e)
             raise e
 
     # noinspection PyIncorrectDocstring
@@ -702,9 +829,7 @@ class ProperPath(Path):
             The decoded contents of the pointed-to file as a string or default (when the file does not exist).
         """
         try:
-            if sys.version_info.minor >= 13:
-                return super().read_text(encoding, errors, newline)
-            return super().read_text(encoding, errors)
+            return _read_text(self, encoding, errors, newline)
         except FileNotFoundError:
             return default
 
@@ -769,26 +894,46 @@ class ProperPath(Path):
                         )
 
         sys_platform: str = "all" if all_platforms else sys.platform
+        # The metadata file names are selected once, so each path only needs a single set lookup.
+        metadata_files: set[str]
         match sys_platform:
             case "all":
-                for p in self.rglob("*"):
-                    if p.name in itertools.chain.from_iterable(
-                        self.__class__.metadata_file_by_platforms.values()
-                    ):
-                        _remove_metadata(p)
+                metadata_files = set().union(
+                    *self.__class__.metadata_file_by_platforms.values()
+                )
             case PlatformNames.darwin | PlatformNames.win32 | PlatformNames.linux:
-                for p in self.rglob("*"):
-                    if (
-                        p.name
-                        in self.__class__.metadata_file_by_platforms[sys_platform]
-                    ):
-                        _remove_metadata(p)
+                metadata_files = self.__class__.metadata_file_by_platforms[sys_platform]
             case _:
                 raise ValueError(
                     f"Platform '{sys_platform}' is unsupported for removing metadata files. "
                     f"Supported platforms are: "
                     f"{self.__class__.metadata_file_by_platforms.keys()}"
                 )
+        # An explicit stack of os.scandir() calls is used instead of rglob("*"). DirEntry already knows its
+        # name and type, so no Path is created for the entries that aren't metadata files.
+        dirs: list[str] = [str(self)]
+        while dirs:
+            try:
+                entries = os.scandir(dirs.pop())
+            except OSError:
+                # Like rglob, directories that can't be scanned are skipped.
+                continue
+            with entries:
+                for entry in entries:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                    if entry.name in metadata_files:
+                        # The kind is already known from the DirEntry, so remove() doesn't
+                        # need to stat the path again. Like in remove(), a symlink is
+                        # removed as a file.
+                        _remove_metadata(
+                            self.__class__(
+                                entry.path,
+                                kind="dir" if is_dir else "file",
+                                err_logger=self.err_logger,
+                            )
+                        )
+                    elif is_dir:
+                        dirs.append(entry.path)
 
 
 P = ProperPath
@@ -1,7 +1,6 @@
 import logging
-import string
+import secrets
 from pathlib import Path
-from random import choices
 from types import NoneType
 from typing import Iterable, Optional, Self, Union
 
@@ -80,9 +79,7 @@ class PathWriteValidator(Validator):
         """
         self.path = path
         self.err_logger = err_logger or ProperPath.default_err_logger
-        self._tmp_file = (
-            f".tmp_{''.join(choices(string.ascii_lowercase + string.digits, k=16))}"
-        )
+        self._tmp_file = f".tmp_{secrets.token_hex(8)}"
         self.retain_created_file = retain_created_file
         self.__self_created_files: list = []
 
@@ -125,9 +122,12 @@ class PathWriteValidator(Validator):
                     p = ProperPath(p, err_logger=self.err_logger)
                 except (ValueError, TypeError):
                     continue
+            # Auto-detected kind costs a stat call on every access, so it's only looked up once.
+            # Creating the path (if it doesn't exist) doesn't change the detected kind.
+            p_kind = p.kind
             p_child = (
-                ProperPath(p / self._tmp_file, kind="file", err_logger=self.err_logger)
-                if p.kind == "dir"
+                ProperPath(p, self._tmp_file, kind="file", err_logger=self.err_logger)
+                if p_kind == "dir"
                 else p
             )
             try:
@@ -135,17 +135,25 @@ class PathWriteValidator(Validator):
                     p.create()
                     self._self_created_files.append(p)
                     _self_created_file = True
-                with p_child.open(mode="ba+") as f:
-                    f.write(
-                        b"\x06"
-                    )  # Throwback: \x06 is the ASCII "Acknowledge" character
-                    f.seek(f.tell() - 1)
-                    if (
-                        not f.read(1) == b"\x06"
-                    ):  # This checks for /dev/null-type special files!
-                        continue  # It'd not be possible to read from those files.
-                    f.seek(f.tell() - 1)
-                    f.truncate()
+                if p_kind == "dir":
+                    # The temporary file is a new regular file that is removed right after,
+                    # so a successful unbuffered write is enough. The read-back and truncate
+                    # below are only needed for the given file itself.
+                    with p_child.open(mode="ab", buffering=0) as f:
+                        f.write(b"\x06")
+                else:
+                    # Unbuffered, so no read/write buffer is allocated for a one-byte probe.
+                    with p_child.open(mode="ba+", buffering=0) as f:
+                        f.write(
+                            b"\x06"
+                        )  # Throwback: \x06 is the ASCII "Acknowledge" character
+                        f.seek(f.tell() - 1)
+                        if (
+                            not f.read(1) == b"\x06"
+                        ):  # This checks for /dev/null-type special files!
+                            continue  # It'd not be possible to read from those files.
+                        f.seek(f.tell() - 1)
+                        f.truncate()
             except (
                 p.PathException,
                 p_child.PathException,
@@ -155,12 +163,12 @@ class PathWriteValidator(Validator):
                 errno = getattr(e, "errno", None)
                 continue
             else:
-                if p.kind == "dir":
+                if p_kind == "dir":
                     p_child.remove(verbose=False)
                 if (
                     not self.retain_created_file
                     and _self_created_file
-                    and p.kind == "file"
+                    and p_kind == "file"
                     and p.stat().st_size == 0
                 ):
                     p.remove()
@@ -1,6 +1,8 @@
 import logging
 import os
 import stat
+import weakref
+from copy import deepcopy
 from pathlib import Path
 
 import pytest
@@ -37,6 +39,15 @@ def test_properpath_initialization(tmp_path):
     assert str(p_multi) == str(home_dir / "Downloads")
     assert p_multi.actual == ("~", "Downloads")
 
+    # A leading "./" is dropped by pathlib, so "./~" is expanded too
+    p_dot = ProperPath("./~", "Downloads")
+    assert str(p_dot) == str(home_dir / "Downloads")
+    assert p_dot.parts == (home_dir / "Downloads").parts
+
+    # actual is read-only, like the underlying Path
+    with pytest.raises(AttributeError):
+        p_dot.actual = ("/tmp",)
+
 
 def test_pathlib_compatibility(tmp_path):
     """Tests that ProperPath instances behave like pathlib.Path instances."""
@@ -57,6 +68,23 @@ def test_truediv_operator(tmp_path):
     p2 = p1 / "a" / "b"
     assert isinstance(p2, ProperPath)
     assert str(p2) == str(tmp_path / "a" / "b")
+    # The user directory stays expanded, and the error logger is passed on.
+    logger = logging.getLogger("test_truediv_operator")
+    p3 = ProperPath("~", err_logger=logger) / "a"
+    assert str(p3) == str(Path.home() / "a")
+    assert p3.err_logger is logger
+    # actual stays a single segment, however many joins were chained
+    assert p2.actual == (os.path.join(tmp_path, "a", "b"),)
+    assert p3.actual == (os.path.join(Path.home(), "a"),)
+
+    # Unsupported operands are left to other.__rtruediv__
+    class Other:
+        def __rtruediv__(self, other):
+            return "rtruediv"
+
+    assert p1 / Other() == "rtruediv"
+    with pytest.raises(TypeError):
+        p1 / 1
 
 
 def test_kind_detection(tmp_path):
@@ -83,6 +111,10 @@ def test_kind_detection(tmp_path):
     assert p_existing_dir.kind == "dir"
     assert p_existing_dir.exists()
 
+    # Kind detection for a special file (e.g., /dev/null)
+    if os.name != "nt":
+        assert ProperPath(os.devnull).kind == "file"
+
     # Explicitly setting kind
     explicit_file = ProperPath(tmp_path / "no_suffix_as_file", kind="file")
     assert explicit_file.kind == "file"
@@ -93,6 +125,44 @@ def test_kind_detection(tmp_path):
     with pytest.raises(ValueError):
         ProperPath("test", kind="invalid_kind")
 
+    # Permission errors aren't hidden behind a guessed kind
+    no_access_dir = tmp_path / "no_access"
+    no_access_dir.mkdir()
+    os.chmod(no_access_dir, 0)
+    with pytest.raises(PermissionError):
+        _ = ProperPath(no_access_dir / "file.txt").kind
+    os.chmod(no_access_dir, stat.S_IRWXU)
+
+
+def test_deepcopy():
+    """Tests that deepcopy keeps the ProperPath attributes."""
+    logger = logging.getLogger("properpath_test")
+    p = ProperPath("~", "file.txt", kind="dir", err_logger=logger)
+    p_copy = deepcopy(p)
+    assert p_copy == p and p_copy is not p
+    assert p_copy.actual == ("~", "file.txt")
+    assert p_copy.kind == "dir"
+    assert p_copy.err_logger is logger
+    assert p_copy.PathException is NoException
+
+    class SubProperPath(ProperPath):
+        pass
+
+    sub_p = SubProperPath("~", "file.txt")
+    sub_p.extra = ["value"]
+    sub_p_copy = deepcopy(sub_p)
+    assert sub_p_copy.actual == ("~", "file.txt")
+    assert sub_p_copy.extra == ["value"] and sub_p_copy.extra is not sub_p.extra
+
+
+def test_slots():
+    """Tests that ProperPath has no __dict__ but still supports weak references."""
+    p = ProperPath("file.txt")
+    with pytest.raises(AttributeError):
+        p.extra = "value"
+    assert weakref.ref(p)() is p
+    assert deepcopy(p) == p
+
 
 def test_create_and_remove_file(tmp_path):
     """Tests creating and removing a file."""
@@ -158,6 +228,57 @@ def test_remove_dir_parent_only(tmp_path):
     assert not file_no_ext.exists(), "File without extension should have been removed"
 
 
+def test_remove_dir_with_symlinks(tmp_path):
+    """Tests that remove() deletes symlinks inside a directory but not their targets."""
+    base_dir = ProperPath(tmp_path / "base", kind="dir")
+    base_dir.create()
+    target_dir = tmp_path / "target"
+    target_dir.mkdir()
+    (target_dir / "keep.txt").touch()
+    try:
+        (base_dir / "dir_link").symlink_to(target_dir, target_is_directory=True)
+        (base_dir / "broken_link").symlink_to(tmp_path / "non_existent")
+    except OSError:
+        pytest.skip("Symlinks are not supported")
+
+    base_dir.remove(parent_only=True)
+    assert (base_dir / "dir_link").is_symlink()
+    assert not (base_dir / "broken_link").is_symlink()
+
+    base_dir.remove()
+    assert not list(base_dir.iterdir())
+    assert (target_dir / "keep.txt").exists()
+
+
+def test_remove_platform_metadata(tmp_path):
+    """Tests that remove_platform_metadata removes metadata files recursively."""
+    base_dir = ProperPath(tmp_path / "base", kind="dir")
+    (base_dir / "sub").mkdir(parents=True)
+    for name in (".DS_Store", "Thumbs.db", "keep.txt"):
+        (base_dir / name).touch()
+        (base_dir / "sub" / name).touch()
+    (base_dir / "sub" / ".Trash-1000" / "files").mkdir(parents=True)
+    (base_dir / "sub" / ".Trash-1000" / "files" / "keep.txt").touch()
+
+    base_dir.remove_platform_metadata(all_platforms=True)
+    assert sorted(os.listdir(base_dir)) == ["keep.txt", "sub"]
+    # remove() empties a metadata directory but keeps the directory itself.
+    assert sorted(os.listdir(base_dir / "sub")) == [".Trash-1000", "keep.txt"]
+    assert os.listdir(base_dir / "sub" / ".Trash-1000") == []
+
+
+def test_get_text_and_bytes(tmp_path):
+    """Tests get_text and get_bytes with and without an existing file."""
+    file_path = ProperPath(tmp_path / "file.txt")
+    assert file_path.get_text() is None
+    assert file_path.get_text(default="{}") == "{}"
+    assert file_path.get_bytes(default=b"") == b""
+
+    file_path.write_text("hello", encoding="utf-8")
+    assert file_path.get_text(encoding="utf-8", default="{}") == "hello"
+    assert file_path.get_bytes() == b"hello"
+
+
 def test_path_exception_handling(tmp_path):
     """Tests that PathException property is set correctly on errors."""
     # Test on create()
@@ -196,3 +317,20 @@ def test_default_path_exception():
     """Tests that PathException defaults to NoException."""
     p = ProperPath(".")
     assert p.PathException is NoException
+
+
+def test_platformdirs_attrs():
+    """Tests that only platformdirs directory attributes are wrapped in ProperPath."""
+    dirs = ProperPath.platformdirs("MyApp", "MyOrg", version="1.0")
+    assert isinstance(dirs.user_data_dir, ProperPath)
+    assert isinstance(dirs.user_config_path, ProperPath)
+    assert isinstance(dirs.site_cache_dir, ProperPath)
+    assert str(dirs.user_data_dir).endswith(os.path.join("MyApp", "1.0"))
+    # Non-directory attributes are left untouched
+    assert dirs.appname == "MyApp"
+    assert dirs.version == "1.0"
+    assert dirs.path_cls is ProperPath
+    # A new ProperPath is returned on each access, so later changes are honored
+    assert dirs.user_data_dir is not dirs.user_data_dir
+    dirs.version = "2.0"
+    assert str(dirs.user_data_dir).endswith(os.path.join("MyApp", "2.0"))
@@ -7,6 +7,16 @@ from properpath import ProperPath
 from properpath.validators import PathValidationError, PathWriteValidator
 
 
+@pytest.fixture(scope="module")
+def read_only_dir(tmp_path_factory):
+    """A read-only directory shared by the tests that only need to fail writing to it."""
+    read_only_dir = tmp_path_factory.mktemp("read_only")
+    os.chmod(read_only_dir, stat.S_IREAD | stat.S_IXUSR)
+    yield read_only_dir
+    # Clean up
+    os.chmod(read_only_dir, stat.S_IWRITE | stat.S_IREAD | stat.S_IXUSR)
+
+
 def test_pathwritevalidator_writable_dir(tmp_path):
     """Tests validation on a writable directory."""
     validator = PathWriteValidator(tmp_path)
@@ -48,51 +58,30 @@ def test_pathwritevalidator_retain_created_file_false(tmp_path):
     assert not file_path.exists()
 
 
-def test_pathwritevalidator_with_iterable_paths(tmp_path):
+def test_pathwritevalidator_with_iterable_paths(tmp_path, read_only_dir):
     """Tests validation with a list of paths, where one is valid."""
     writable_path = tmp_path / "writable"
     writable_path.mkdir()
 
-    read_only_dir = tmp_path / "read_only"
-    read_only_dir.mkdir()
-    os.chmod(read_only_dir, stat.S_IREAD | stat.S_IXUSR)
-
     paths = [read_only_dir, writable_path]
 
     validator = PathWriteValidator(paths)
     validated_path = validator.validate()
     assert validated_path == writable_path
 
-    # Clean up
-    os.chmod(read_only_dir, stat.S_IWRITE | stat.S_IREAD | stat.S_IXUSR)
-
 
-def test_pathwritevalidator_no_writable_path(tmp_path):
+def test_pathwritevalidator_no_writable_path(read_only_dir):
     """Tests that PathValidationError is raised when no paths are writable."""
-    read_only_dir = tmp_path / "read_only"
-    read_only_dir.mkdir()
-    os.chmod(read_only_dir, stat.S_IREAD | stat.S_IXUSR)
-
     validator = PathWriteValidator(read_only_dir)
     with pytest.raises(PathValidationError) as excinfo:
         validator.validate()
     assert "Given path(s) could not be validated!" in str(excinfo.value)
 
-    # Clean up
-    os.chmod(read_only_dir, stat.S_IWRITE | stat.S_IREAD | stat.S_IXUSR)
-
 
-def test_pathwritevalidator_with_uncreatable_file(tmp_path):
+def test_pathwritevalidator_with_uncreatable_file(read_only_dir):
     """Tests validation with a file in a read-only directory."""
-    read_only_dir = tmp_path / "ro_dir"
-    read_only_dir.mkdir()
-    os.chmod(read_only_dir, stat.S_IREAD | stat.S_IXUSR)
-
     file_in_ro_dir = read_only_dir / "file.txt"
 
     validator = PathWriteValidator(file_in_ro_dir)
     with pytest.raises(PathValidationError):
         validator.validate()
-
-    # Clean up
-    os.chmod(read_only_dir, stat.S_IWRITE | stat.S_IREAD | stat.S_IXUSR)